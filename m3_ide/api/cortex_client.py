@@ -1,22 +1,34 @@
 from typing import List, Dict, Any, Optional
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from sklearn.decomposition import PCA
-from sklearn.mixture import GaussianMixture
+
+from ..core.quantum_ops import rotate_pairs
 
 class CortexClient:
     """Local implementation of Cortex-like creative AI capabilities"""
-    
+
+    _ADJECTIVES = ("novel", "unique", "creative", "innovative")
+    _VERBS = ("combines", "integrates", "merges", "synthesizes")
+
     def __init__(self):
         self.model = SentenceTransformer('all-MiniLM-L6-v2')
-        self.pca = PCA(n_components=3)
-        self.gmm = GaussianMixture(n_components=5, random_state=42)
-        
-    def generate_ideas(self, prompt: str, context: Optional[Dict] = None, 
+        self._rng = np.random.default_rng()
+        self._prompt_cache: Dict[str, np.ndarray] = {}
+        self._rotate_scratch: Optional[np.ndarray] = None
+
+    def _encode_prompt(self, prompt: str) -> np.ndarray:
+        """Encode a prompt, caching the embedding so repeated calls skip the model"""
+        cached = self._prompt_cache.get(prompt)
+        if cached is None:
+            cached = self.model.encode([prompt])[0]
+            self._prompt_cache[prompt] = cached
+        return cached
+
+    def generate_ideas(self, prompt: str, context: Optional[Dict] = None,
                       quantum_state: Optional[Dict] = None) -> Dict[str, Any]:
         """Generate creative ideas using quantum-inspired embeddings"""
-        # Generate base embedding
-        base_embedding = self.model.encode([prompt])[0]
+        # Generate base embedding (cached per prompt)
+        base_embedding = self._encode_prompt(prompt)
         
         # Apply quantum transformation if state exists
         if quantum_state:
@@ -26,8 +38,9 @@ class CortexClient:
         # Generate variations
         variations = self._generate_variations(base_embedding)
         
-        # Convert back to ideas
-        ideas = self._embeddings_to_ideas(variations, prompt)
+        # Build one idea text per variation, scored against the cached
+        # prompt embedding
+        ideas = self._make_ideas(len(variations), prompt, self._encode_prompt(prompt))
         
         # Update quantum state
         new_state = self._update_quantum_state(variations)
@@ -40,59 +53,61 @@ class CortexClient:
         
     def _apply_quantum_transform(self, embedding: np.ndarray, phase: float) -> np.ndarray:
         """Apply quantum transformation to embedding"""
-        # Simulate quantum rotation
-        theta = phase * 2 * np.pi
-        rotation_matrix = np.array([
-            [np.cos(theta), -np.sin(theta)],
-            [np.sin(theta), np.cos(theta)]
-        ])
-        
-        # Apply rotation to pairs of dimensions
-        transformed = embedding.copy()
-        for i in range(0, len(embedding)-1, 2):
-            transformed[i:i+2] = rotation_matrix @ embedding[i:i+2]
-            
-        return transformed
+        # Reuse a per-instance scratch buffer to avoid a fresh allocation
+        # on every request
+        if (self._rotate_scratch is None
+                or self._rotate_scratch.shape != embedding.shape
+                or self._rotate_scratch.dtype != embedding.dtype):
+            self._rotate_scratch = np.empty_like(embedding)
+        return rotate_pairs(embedding, phase, out=self._rotate_scratch)
         
     def _generate_variations(self, base_embedding: np.ndarray, n_variations: int = 5) -> np.ndarray:
         """Generate variations of the base embedding"""
-        # Fit GMM to create a probability distribution
-        samples = base_embedding + np.random.normal(0, 0.1, size=(100, len(base_embedding)))
-        self.gmm.fit(samples.reshape(-1, len(base_embedding)))
+        # Sample directly from a Gaussian around the base embedding
+        noise = self._rng.standard_normal((n_variations, base_embedding.size)) * 0.1
+        return base_embedding[None, :] + noise
         
-        # Sample new points
-        variations = self.gmm.sample(n_variations)[0]
-        return variations
-        
-    def _embeddings_to_ideas(self, embeddings: np.ndarray, original_prompt: str) -> List[Dict]:
-        """Convert embeddings back to ideas using the model's token space"""
-        ideas = []
-        base_tokens = set(original_prompt.lower().split())
-        
-        for i, emb in enumerate(embeddings):
-            # Generate variation
-            variation = f"Idea {i+1}: A {np.random.choice(['novel', 'unique', 'creative', 'innovative'])} "
-            variation += f"approach that {np.random.choice(['combines', 'integrates', 'merges', 'synthesizes'])} "
-            variation += original_prompt
-            
-            # Calculate similarity score
-            score = float(np.dot(emb, self.model.encode([original_prompt])[0]))
-            
-            ideas.append({
-                'text': variation,
-                'score': score
-            })
-            
-        return sorted(ideas, key=lambda x: x['score'], reverse=True)
+    def _make_ideas(self, n_variations: int, original_prompt: str,
+                    prompt_embedding: np.ndarray) -> List[Dict]:
+        """Generate idea texts and score them against the prompt embedding"""
+        # Build all variation texts up front so they encode as one batch,
+        # drawing all the word choices in two integer RNG calls
+        n = n_variations
+        adj_idx = self._rng.integers(len(self._ADJECTIVES), size=n)
+        verb_idx = self._rng.integers(len(self._VERBS), size=n)
+        texts = [
+            f"Idea {i+1}: A {self._ADJECTIVES[adj_idx[i]]} "
+            f"approach that {self._VERBS[verb_idx[i]]} {original_prompt}"
+            for i in range(n)
+        ]
+
+        # One batched encode for every candidate, then one matrix-vector score
+        text_embeddings = self.model.encode(
+            texts,
+            batch_size=len(texts),
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        prompt_norm = prompt_embedding / (np.linalg.norm(prompt_embedding) + 1e-12)
+        scores = text_embeddings @ prompt_norm
+
+        order = np.argsort(scores)[::-1]
+        return [{'text': texts[i], 'score': float(scores[i])} for i in order]
         
     def _update_quantum_state(self, variations: np.ndarray) -> Dict[str, Any]:
         """Update quantum state based on variations"""
-        # Calculate new phase from principal components
-        transformed = self.pca.fit_transform(variations)
-        phase = float(np.arctan2(transformed[0, 1], transformed[0, 0]) / (2 * np.pi))
+        # Calculate new phase from the top-2 principal components via one SVD
+        centered = variations - variations.mean(axis=0)
+        _, _, vt = np.linalg.svd(centered, full_matrices=False)
+        proj = centered[0] @ vt[:2].T
+        phase = float(np.arctan2(proj[1], proj[0]) / (2 * np.pi))
         
+        # Analytic Gaussian log-likelihood of the variations around their mean
+        sigma2 = float(np.mean(centered ** 2)) + 1e-12
+        entropy = float(-0.5 * variations.shape[1] * (np.log(2 * np.pi * sigma2) + 1.0))
+
         return {
             'phase': phase,
-            'entropy': float(self.gmm.score(variations)),
+            'entropy': entropy,
             'timestamp': None  # Let the server add this
         }
@@ -1,8 +1,10 @@
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Dict, List, Optional
 
-@dataclass
+_MODEL_CACHE_DIR = os.path.expanduser("~/.cache/m3_ide/models")
+
+@dataclass(slots=True)
 class M3Config:
     """Configuration for M3-optimized components"""
     mps_enabled: bool = True
@@ -11,7 +13,7 @@ class M3Config:
     cache_size: int = 4 * 1024  # 4GB in MB
     quantization: str = "int8"
     
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for AI models"""
     nemotron_api_key: str
@@ -20,7 +22,7 @@ class ModelConfig:
     max_batch_size: int = 32
     streaming: bool = True
     
-@dataclass
+@dataclass(slots=True)
 class RAGConfig:
     """Configuration for RAG system"""
     chunk_size: int = 512
@@ -28,7 +30,7 @@ class RAGConfig:
     embedding_model: str = "BAAI/bge-small-en-v1.5"
     similarity_metric: str = "cosine"
     
-@dataclass
+@dataclass(slots=True)
 class QuantumConfig:
     """Configuration for quantum-inspired features"""
     state_dim: int = 1024
@@ -42,10 +44,11 @@ class IDEConfig:
         self.model = ModelConfig(
             nemotron_api_key=os.getenv("NVIDIA_NGC_KEY", ""),
             hf_api_key=os.getenv("HF_API_KEY", ""),
-            model_cache_dir=os.path.expanduser("~/.cache/m3_ide/models")
+            model_cache_dir=_MODEL_CACHE_DIR
         )
         self.rag = RAGConfig()
         self.quantum = QuantumConfig()
+        self._cached_dict: Optional[Dict] = None
         
     @property
     def is_valid(self) -> bool:
@@ -53,13 +56,15 @@ class IDEConfig:
         return bool(self.model.nemotron_api_key and self.model.hf_api_key)
         
     def to_dict(self) -> Dict:
-        """Convert configuration to dictionary"""
-        return {
-            "m3": self.m3.__dict__,
-            "model": self.model.__dict__,
-            "rag": self.rag.__dict__,
-            "quantum": self.quantum.__dict__
-        }
+        """Convert configuration to dictionary (memoized)"""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "m3": asdict(self.m3),
+                "model": asdict(self.model),
+                "rag": asdict(self.rag),
+                "quantum": asdict(self.quantum)
+            }
+        return self._cached_dict
         
     @classmethod
     def from_dict(cls, config_dict: Dict) -> 'IDEConfig':
@@ -69,4 +74,5 @@ class IDEConfig:
         config.model = ModelConfig(**config_dict.get("model", {}))
         config.rag = RAGConfig(**config_dict.get("rag", {}))
         config.quantum = QuantumConfig(**config_dict.get("quantum", {}))
+        config._cached_dict = None
         return config
@@ -0,0 +1,81 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to vectorized NumPy
+    njit = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; blake2b is always available
+    xxhash = None
+
+def seed_from_data(data) -> int:
+    """Derive a 64-bit PRNG seed from arbitrary data.
+
+    Uses the SIMD-accelerated xxh3 when available and blake2b otherwise;
+    both are far cheaper than a cryptographic SHA-256 digest parsed into
+    a 256-bit Python int, and the result feeds np.random.default_rng
+    directly.
+    """
+    payload = str(data).encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(payload)
+    import hashlib
+    return int.from_bytes(
+        hashlib.blake2b(payload, digest_size=8).digest(), "big"
+    )
+
+def _rotate_pairs_kernel(flat: np.ndarray, cos_t: float, sin_t: float) -> None:
+    """In-place 2-lane rotation over consecutive dimension pairs"""
+    for i in range(0, flat.shape[0] - 1, 2):
+        a = flat[i]
+        b = flat[i + 1]
+        flat[i] = cos_t * a - sin_t * b
+        flat[i + 1] = sin_t * a + cos_t * b
+
+if njit is not None:
+    _rotate_pairs_kernel = njit(cache=True, fastmath=True)(_rotate_pairs_kernel)
+
+def rotate_pairs(embedding: np.ndarray, phase: float,
+                 out: np.ndarray = None) -> np.ndarray:
+    """Apply the quantum pair rotation for a phase in [0, 1) to an embedding.
+
+    Accepts 1-D (d,) or 2-D (batch, d) arrays; any odd trailing dimension
+    is left untouched. Rotates into `out` when a matching scratch buffer
+    is supplied, otherwise allocates a fresh array.
+    """
+    theta = phase * 2 * np.pi
+
+    if out is not None and out.shape == embedding.shape and out.dtype == embedding.dtype:
+        np.copyto(out, embedding)
+        transformed = out
+    else:
+        transformed = np.ascontiguousarray(embedding).copy()
+    batch = np.atleast_2d(transformed)
+    n = batch.shape[1] & ~1
+
+    # The 2x2 rotation of each (x, y) pair is complex multiplication of
+    # (x + iy) by e^{i*theta}: view the pair lanes as complex and scale
+    # in place with a single scalar multiply
+    if transformed.dtype == np.float32:
+        factor = np.complex64(np.cos(theta) + 1j * np.sin(theta))
+        view = batch[:, :n].view(np.complex64)
+    elif transformed.dtype == np.float64:
+        factor = np.complex128(np.cos(theta) + 1j * np.sin(theta))
+        view = batch[:, :n].view(np.complex128)
+    else:
+        cos_t = float(np.cos(theta))
+        sin_t = float(np.sin(theta))
+        if njit is not None:
+            for row in batch:
+                _rotate_pairs_kernel(row, cos_t, sin_t)
+            return transformed
+        rotation = np.array([[cos_t, -sin_t], [sin_t, cos_t]])
+        batch[:, :n] = (
+            batch[:, :n].reshape(batch.shape[0], -1, 2) @ rotation.T
+        ).reshape(batch.shape[0], -1)
+        return transformed
+
+    view *= factor
+    return transformed
@@ -1,21 +1,50 @@
 import httpx
+import io
 import json
 import asyncio
 from typing import AsyncGenerator, Dict, Any, Optional
 from ..core.config import ModelConfig
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json works everywhere
+    _loads = json.loads
+
+_shared_clients: Dict[str, httpx.AsyncClient] = {}
+
+def _get_client(config: ModelConfig) -> httpx.AsyncClient:
+    """Get the pooled client for this config's credentials
+
+    Keyed by API key so models sharing the connection pool never share
+    another instance's Authorization header.
+    """
+    api_key = config.nemotron_api_key
+    client = _shared_clients.get(api_key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {config.nemotron_api_key}",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip"
+            },
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=60.0
+            ),
+            timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
+            transport=httpx.AsyncHTTPTransport(http2=True, retries=2)
+        )
+        _shared_clients[api_key] = client
+    return client
+
 class NemotronModel:
     """Integration with Nemotron-4 340B model"""
     def __init__(self, config: ModelConfig):
         self.config = config
         self.api_base = "https://api.nvidia.com/v1/nemotron"
-        self.client = httpx.AsyncClient(
-            headers={
-                "Authorization": f"Bearer {config.nemotron_api_key}",
-                "Content-Type": "application/json"
-            },
-            timeout=30.0
-        )
+        self.client = _get_client(config)
         
     async def generate_stream(
         self,
@@ -43,7 +72,7 @@ class NemotronModel:
         ) as response:
             async for line in response.aiter_lines():
                 if line.startswith("data: "):
-                    data = json.loads(line[6:])
+                    data = _loads(line[6:])
                     if "choices" in data and data["choices"]:
                         yield data["choices"][0]["text"]
                         
@@ -53,10 +82,10 @@ class NemotronModel:
         **kwargs
     ) -> str:
         """Generate a complete response"""
-        response_chunks = []
+        buf = io.StringIO()
         async for chunk in self.generate_stream(prompt, **kwargs):
-            response_chunks.append(chunk)
-        return "".join(response_chunks)
+            buf.write(chunk)
+        return buf.getvalue()
         
     async def analyze_code(
         self,
@@ -92,7 +121,17 @@ Task: {task}"""
                 analysis[current_section].append(section.strip())
                 
         return analysis
-        
+
+    async def analyze_code_many(
+        self,
+        codes: list,
+        task: str = "analyze"
+    ) -> list:
+        """Analyze several code snippets concurrently over the pooled client"""
+        return await asyncio.gather(
+            *(self.analyze_code(code, task=task) for code in codes)
+        )
+
     async def generate_synthetic_data(
         self,
         schema: Dict[str, Any],
@@ -107,36 +146,37 @@ Format each sample as valid JSON."""
         response = await self.generate(prompt, max_tokens=1000)
         
         try:
-            # Extract JSON objects from response
+            # Extract consecutive JSON objects with the C decoder instead
+            # of a per-character Python loop
+            decoder = json.JSONDecoder()
             samples = []
-            current_sample = ""
-            bracket_count = 0
-            
-            for char in response:
-                if char == "{":
-                    bracket_count += 1
-                elif char == "}":
-                    bracket_count -= 1
-                    
-                current_sample += char
-                
-                if bracket_count == 0 and current_sample.strip():
-                    try:
-                        sample = json.loads(current_sample)
-                        samples.append(sample)
-                        current_sample = ""
-                    except json.JSONDecodeError:
-                        pass
-                        
-            return samples[:num_samples]
+            idx = 0
+
+            while idx < len(response) and len(samples) < num_samples:
+                start = response.find("{", idx)
+                if start == -1:
+                    break
+                try:
+                    sample, end = decoder.raw_decode(response, start)
+                    samples.append(sample)
+                    idx = end
+                except json.JSONDecodeError:
+                    idx = start + 1
+
+            return samples
         except Exception as e:
             print(f"Error parsing synthetic data: {e}")
             return []
             
     async def close(self):
-        """Close the client connection"""
-        await self.client.aclose()
-        
+        """Release this model's reference; the shared client stays open
+
+        The pooled client is shared across every model built with the
+        same API key, so closing one instance must not tear down
+        connections other instances are using.
+        """
+        self.client = None
+
     async def __aenter__(self):
         """Context manager entry"""
         return self
@@ -1,8 +1,77 @@
+import math
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import networkx as nx
+from scipy.special import xlogy
 from ..core.config import QuantumConfig
+from ..core.quantum_ops import seed_from_data
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to vectorized NumPy
+    njit = None
+    prange = range
+
+_INV_SQRT2 = 1.0 / np.sqrt(2)
+
+def _hadamard_kernel(state: np.ndarray, out: np.ndarray,
+                     phase: np.ndarray) -> None:
+    """Pairwise Hadamard fused with phase extraction in one traversal"""
+    for i in prange(state.shape[0] // 2):
+        a = state[2 * i]
+        b = state[2 * i + 1]
+        u = (a + b) * _INV_SQRT2
+        v = (a - b) * _INV_SQRT2
+        out[2 * i] = u
+        out[2 * i + 1] = v
+        phase[2 * i] = math.atan2(u.imag, u.real)
+        phase[2 * i + 1] = math.atan2(v.imag, v.real)
+
+def _pauli_x_kernel(state: np.ndarray, out: np.ndarray,
+                    phase: np.ndarray) -> None:
+    """Pairwise swap fused with phase extraction in one traversal"""
+    for i in prange(state.shape[0] // 2):
+        a = state[2 * i]
+        b = state[2 * i + 1]
+        out[2 * i] = b
+        out[2 * i + 1] = a
+        phase[2 * i] = math.atan2(b.imag, b.real)
+        phase[2 * i + 1] = math.atan2(a.imag, a.real)
+
+def _pauli_z_kernel(state: np.ndarray, out: np.ndarray,
+                    phase: np.ndarray) -> None:
+    """Pairwise sign flip fused with phase extraction in one traversal"""
+    for i in prange(state.shape[0] // 2):
+        a = state[2 * i]
+        b = -state[2 * i + 1]
+        out[2 * i] = a
+        out[2 * i + 1] = b
+        phase[2 * i] = math.atan2(a.imag, a.real)
+        phase[2 * i + 1] = math.atan2(b.imag, b.real)
+
+def _cnot_kernel(state: np.ndarray, out: np.ndarray,
+                 phase: np.ndarray) -> None:
+    """CNOT quad swap fused with phase extraction in one traversal"""
+    for i in prange(state.shape[0] // 4):
+        a = state[4 * i]
+        b = state[4 * i + 1]
+        c = state[4 * i + 2]
+        d = state[4 * i + 3]
+        out[4 * i] = a
+        out[4 * i + 1] = b
+        out[4 * i + 2] = d
+        out[4 * i + 3] = c
+        phase[4 * i] = math.atan2(a.imag, a.real)
+        phase[4 * i + 1] = math.atan2(b.imag, b.real)
+        phase[4 * i + 2] = math.atan2(d.imag, d.real)
+        phase[4 * i + 3] = math.atan2(c.imag, c.real)
+
+if njit is not None:
+    _hadamard_kernel = njit(parallel=True, fastmath=True, cache=True)(_hadamard_kernel)
+    _pauli_x_kernel = njit(parallel=True, fastmath=True, cache=True)(_pauli_x_kernel)
+    _pauli_z_kernel = njit(parallel=True, fastmath=True, cache=True)(_pauli_z_kernel)
+    _cnot_kernel = njit(parallel=True, fastmath=True, cache=True)(_cnot_kernel)
 
 @dataclass
 class QuantumMemory:
@@ -19,15 +88,43 @@ class AdvancedQuantumOps:
         self.config = config
         self.memories: Dict[str, QuantumMemory] = {}
         self.interference_patterns: Dict[str, np.ndarray] = {}
+        # Shape/dtype-keyed output buffers reused across gate applications
+        self._gate_scratch: Dict[Tuple[int, str], np.ndarray] = {}
+        self._conj_scratch: Optional[np.ndarray] = None
+        self._log2_dim = math.log2(config.state_dim)
+
+    def _run_gate(self, state: np.ndarray, kernel, group: int,
+                  phase_out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Run a gate kernel into a pooled buffer, ping-ponging with the state
+
+        The previous state vector becomes the next scratch buffer for its
+        shape, so steady-state gate application allocates nothing. The
+        kernels emit the phase of each output amplitude in the same
+        traversal, halving memory traffic versus a separate np.angle
+        pass.
+        """
+        key = (state.shape[0], state.dtype.str)
+        out = self._gate_scratch.get(key)
+        if out is None or out is state:
+            out = np.empty_like(state)
+        if phase_out is None or phase_out.shape != state.shape:
+            phase_out = np.empty(state.shape, dtype=np.float64)
+        kernel(state, out, phase_out)
+        remainder = state.shape[0] % group
+        if remainder:
+            out[-remainder:] = state[-remainder:]
+            phase_out[-remainder:] = np.angle(state[-remainder:])
+        self._gate_scratch[key] = state
+        return out
         
     def create_memory_state(self, name: str, data: Any) -> QuantumMemory:
         """Create quantum memory state from data"""
         # Convert data to numerical representation
         data_hash = self._hash_data(data)
-        rng = np.random.RandomState(data_hash)
-        
-        # Create quantum state vectors
-        state_vector = rng.randn(self.config.state_dim) + 1j * rng.randn(self.config.state_dim)
+        rng = np.random.default_rng(data_hash)
+
+        # Create quantum state vectors with one interleaved draw
+        state_vector = rng.standard_normal(self.config.state_dim * 2).view(np.complex128)
         state_vector /= np.linalg.norm(state_vector)
         
         phase_vector = np.angle(state_vector)
@@ -46,6 +143,44 @@ class AdvancedQuantumOps:
         self.memories[name] = memory
         return memory
         
+    def create_memory_states_batch(self, names: List[str],
+                                   datas: List[Any]) -> List[QuantumMemory]:
+        """Create many memory states with one batched random draw.
+
+        All N state vectors are drawn as a single (N, dim, 2) array and
+        normalized with one axis-wise norm, amortizing numpy dispatch
+        over the batch; each QuantumMemory holds a view into the shared
+        buffer. Seeding uses the per-data hashes, so the batch is
+        deterministic for the same names/datas.
+        """
+        if len(names) != len(datas):
+            raise ValueError("names and datas must have the same length")
+        if not names:
+            return []
+
+        rng = np.random.default_rng([seed_from_data(d) for d in datas])
+        dim = self.config.state_dim
+
+        vectors = rng.standard_normal((len(names), dim, 2)).view(
+            np.complex128
+        ).reshape(len(names), dim)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        phases = np.angle(vectors)
+
+        memories = []
+        for i, name in enumerate(names):
+            graph = nx.Graph()
+            graph.add_node(name)
+            memory = QuantumMemory(
+                state_vector=vectors[i],
+                phase_vector=phases[i],
+                entanglement_graph=graph,
+                coherence_time=30.0
+            )
+            self.memories[name] = memory
+            memories.append(memory)
+        return memories
+
     def apply_interference(self, state1: str, state2: str) -> np.ndarray:
         """Create interference pattern between two states"""
         if state1 not in self.memories or state2 not in self.memories:
@@ -54,12 +189,21 @@ class AdvancedQuantumOps:
         mem1 = self.memories[state1]
         mem2 = self.memories[state2]
         
-        # Create interference pattern
-        interference = mem1.state_vector * np.conj(mem2.state_vector)
+        # Write the pattern into the persisted buffer; repeat calls for
+        # the same pair reuse it, so the conj and product allocate
+        # nothing in steady state
         pattern_key = f"{state1}_{state2}"
-        self.interference_patterns[pattern_key] = interference
-        
-        return interference
+        buf = self.interference_patterns.get(pattern_key)
+        if buf is None or buf.shape != mem1.state_vector.shape:
+            buf = np.empty_like(mem1.state_vector)
+            self.interference_patterns[pattern_key] = buf
+
+        if self._conj_scratch is None or self._conj_scratch.shape != mem2.state_vector.shape:
+            self._conj_scratch = np.empty_like(mem2.state_vector)
+        np.conjugate(mem2.state_vector, out=self._conj_scratch)
+        np.multiply(mem1.state_vector, self._conj_scratch, out=buf)
+
+        return buf
         
     def measure_coherence(self, state_name: str) -> float:
         """Measure coherence of a quantum state"""
@@ -67,12 +211,14 @@ class AdvancedQuantumOps:
             raise ValueError("State not found")
             
         memory = self.memories[state_name]
-        
-        # Calculate von Neumann entropy
-        eigenvalues = np.abs(memory.state_vector) ** 2
-        entropy = -np.sum(eigenvalues * np.log2(eigenvalues + 1e-10))
-        
-        return 1.0 - entropy / np.log2(self.config.state_dim)
+
+        # Calculate von Neumann entropy; re^2 + im^2 skips the sqrt that
+        # np.abs would take, and xlogy fuses p*log(p) into one C loop
+        # while handling p = 0 exactly instead of via an epsilon
+        probs = memory.state_vector.real**2 + memory.state_vector.imag**2
+        entropy = -xlogy(probs, probs).sum() / math.log(2)
+
+        return 1.0 - entropy / self._log2_dim
         
     def apply_quantum_gate(self, state_name: str, gate_type: str) -> None:
         """Apply quantum gate operation to state"""
@@ -91,64 +237,95 @@ class AdvancedQuantumOps:
         if gate_type not in gates:
             raise ValueError(f"Unknown gate type: {gate_type}")
             
-        memory.state_vector = gates[gate_type](memory.state_vector)
-        memory.phase_vector = np.angle(memory.state_vector)
+        memory.state_vector = gates[gate_type](
+            memory.state_vector, phase_out=memory.phase_vector
+        )
+        if njit is None:
+            # Fallback path has no fused kernel; take the separate pass
+            memory.phase_vector = np.angle(memory.state_vector)
         
     def create_superposition(self, states: List[str]) -> np.ndarray:
         """Create superposition of multiple states"""
-        if not all(state in self.memories for state in states):
+        if not self.memories.keys() >= set(states):
             raise ValueError("All states must exist")
-            
-        # Create equal superposition
-        combined_state = np.zeros(self.config.state_dim, dtype=complex)
-        normalization = 1.0 / np.sqrt(len(states))
-        
-        for state in states:
-            combined_state += normalization * self.memories[state].state_vector
-            
+
+        # Single-state superposition is the state itself; hand back a
+        # view rather than stacking and copying
+        if len(states) == 1:
+            return self.memories[states[0]].state_vector
+
+        # Create equal superposition with one stacked C-level reduction
+        # instead of per-state Python accumulation
+        vecs = np.stack([self.memories[state].state_vector for state in states])
+        combined_state = vecs.sum(axis=0)
+        combined_state *= 1.0 / np.sqrt(len(states))
         return combined_state
         
     def measure_entanglement(self, state1: str, state2: str) -> float:
         """Measure entanglement between two states"""
-        if state1 not in self.memories or state2 not in self.memories:
+        if not self.memories.keys() >= {state1, state2}:
             raise ValueError("States not found")
-            
+
+        # A state carries no entanglement entropy with itself
+        if state1 == state2:
+            return 0.0
+
         mem1 = self.memories[state1]
         mem2 = self.memories[state2]
-        
-        # Calculate quantum mutual information
-        joint_state = np.outer(mem1.state_vector, mem2.state_vector)
-        schmidt_values = np.linalg.svd(joint_state, compute_uv=False)
-        
+
+        # The joint state is the rank-1 outer product of the two vectors,
+        # so its only nonzero Schmidt value is |v1|*|v2|; computing it
+        # directly skips the dim x dim allocation and the full SVD
+        schmidt_sq = (
+            np.vdot(mem1.state_vector, mem1.state_vector).real
+            * np.vdot(mem2.state_vector, mem2.state_vector).real
+        )
+
         # Calculate entanglement entropy
-        entropy = -np.sum(schmidt_values**2 * np.log2(schmidt_values**2 + 1e-10))
+        entropy = -schmidt_sq * np.log2(schmidt_sq + 1e-10)
         return entropy
         
-    def _hadamard_gate(self, state: np.ndarray) -> np.ndarray:
+    def _hadamard_gate(self, state: np.ndarray,
+                       phase_out: Optional[np.ndarray] = None) -> np.ndarray:
         """Apply Hadamard gate"""
-        hadamard = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
-        return np.dot(hadamard, state.reshape(-1, 2)).flatten()
-        
-    def _pauli_x_gate(self, state: np.ndarray) -> np.ndarray:
+        if njit is not None:
+            return self._run_gate(state, _hadamard_kernel, 2, phase_out)
+        # Explicit add/sub on the pair columns hits numpy's SIMD ufunc
+        # loops instead of dispatching a 2x2 matmul through BLAS
+        pairs = state.reshape(-1, 2)
+        out = np.empty_like(pairs)
+        np.add(pairs[:, 0], pairs[:, 1], out=out[:, 0])
+        np.subtract(pairs[:, 0], pairs[:, 1], out=out[:, 1])
+        out *= _INV_SQRT2
+        return out.ravel()
+
+    def _pauli_x_gate(self, state: np.ndarray,
+                      phase_out: Optional[np.ndarray] = None) -> np.ndarray:
         """Apply Pauli-X (NOT) gate"""
-        pauli_x = np.array([[0, 1], [1, 0]])
-        return np.dot(pauli_x, state.reshape(-1, 2)).flatten()
-        
-    def _pauli_z_gate(self, state: np.ndarray) -> np.ndarray:
+        if njit is not None:
+            return self._run_gate(state, _pauli_x_kernel, 2, phase_out)
+        # X is a column swap on the pair view
+        return np.ascontiguousarray(state.reshape(-1, 2)[:, ::-1]).ravel()
+
+    def _pauli_z_gate(self, state: np.ndarray,
+                      phase_out: Optional[np.ndarray] = None) -> np.ndarray:
         """Apply Pauli-Z gate"""
-        pauli_z = np.array([[1, 0], [0, -1]])
-        return np.dot(pauli_z, state.reshape(-1, 2)).flatten()
-        
-    def _cnot_gate(self, state: np.ndarray) -> np.ndarray:
+        if njit is not None:
+            return self._run_gate(state, _pauli_z_kernel, 2, phase_out)
+        # Z negates the second element of every pair
+        out = state.reshape(-1, 2).copy()
+        np.negative(out[:, 1], out=out[:, 1])
+        return out.ravel()
+
+    def _cnot_gate(self, state: np.ndarray,
+                   phase_out: Optional[np.ndarray] = None) -> np.ndarray:
         """Apply CNOT gate"""
-        cnot = np.array([[1, 0, 0, 0],
-                        [0, 1, 0, 0],
-                        [0, 0, 0, 1],
-                        [0, 0, 1, 0]])
-        return np.dot(cnot, state.reshape(-1, 4)).flatten()
+        if njit is not None:
+            return self._run_gate(state, _cnot_kernel, 4, phase_out)
+        # CNOT is a permutation, so a single fancy-index gather beats a
+        # matmul dispatch
+        return state.reshape(-1, 4)[:, (0, 1, 3, 2)].ravel()
         
     def _hash_data(self, data: Any) -> int:
-        """Create hash from data"""
-        import hashlib
-        data_str = str(data)
-        return int(hashlib.sha256(data_str.encode()).hexdigest(), 16)
+        """Create 64-bit seed hash from data"""
+        return seed_from_data(data)
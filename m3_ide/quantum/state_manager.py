@@ -1,19 +1,42 @@
+import random
+
 import numpy as np
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from ..core.config import QuantumConfig
 
+# Simple word variation table; tuples so lookups index without copying
+_SYNONYMS = {
+    "analyze": ("examine", "investigate", "study"),
+    "create": ("generate", "produce", "develop"),
+    "improve": ("enhance", "optimize", "upgrade"),
+    "error": ("issue", "problem", "bug"),
+    # Add more synonyms as needed
+}
+
 @dataclass
 class QuantumState:
-    """Represents a quantum-inspired state"""
-    amplitude: np.ndarray  # Complex amplitudes
+    """Represents a quantum-inspired state
+
+    Amplitude and phase are kept as separate real float64 planes (SoA);
+    all mutation happens on the real arrays and the interleaved complex
+    vector is only materialized on demand.
+    """
+    amplitude: np.ndarray  # Real amplitude plane
     phase: np.ndarray     # Phase information
     entangled_states: List[int]  # IDs of entangled states
-    
+
     @property
     def state_vector(self) -> np.ndarray:
         """Get the full state vector"""
-        return self.amplitude * np.exp(1j * self.phase)
+        # Fill the real/imag planes of the complex buffer directly so
+        # the work stays in real SIMD lanes instead of complex exp and
+        # complex multiply
+        vec = np.empty(self.amplitude.shape, dtype=np.complex128)
+        np.multiply(self.amplitude, np.cos(self.phase), out=vec.real)
+        np.multiply(self.amplitude, np.sin(self.phase), out=vec.imag)
+        return vec
 
 class SuperpositionGenerator:
     """Generates superposition-like prompt variations"""
@@ -21,37 +44,39 @@ class SuperpositionGenerator:
         self.config = config
         self.state_dim = config.state_dim
         self.depth = config.superposition_depth
-        
+        # Precompute one unitary per depth level; the QR factorization is
+        # O(dim^3) so paying it once at init leaves each prompt with only
+        # matvecs
+        self._unitaries = [
+            self._random_unitary(self.state_dim) for _ in range(self.depth)
+        ]
+
     def create_superposition(self, base_prompt: str) -> List[str]:
         """Create variations of the base prompt"""
         variations = []
         state = self._create_initial_state(base_prompt)
-        
-        for _ in range(self.depth):
+
+        for unitary in self._unitaries:
             # Apply quantum-inspired transformation
-            new_state = self._apply_transformation(state)
+            new_state = unitary @ state
             # Generate variation from new state
             variation = self._state_to_prompt(new_state, base_prompt)
             variations.append(variation)
-            
+
         return variations
         
     def _create_initial_state(self, prompt: str) -> np.ndarray:
         """Create initial quantum state from prompt"""
-        # Hash prompt to create initial amplitudes
-        hash_val = sum(ord(c) * (i + 1) for i, c in enumerate(prompt))
-        rng = np.random.RandomState(hash_val)
-        
-        # Create normalized state vector
-        state = rng.randn(self.state_dim) + 1j * rng.randn(self.state_dim)
+        # Hash prompt to create initial amplitudes; the position-weighted
+        # byte sum runs as one vectorized dot instead of a char loop
+        data = np.frombuffer(prompt.encode("utf-8"), dtype=np.uint8)
+        hash_val = int(data.astype(np.int64) @ np.arange(1, data.size + 1))
+        rng = np.random.default_rng(hash_val)
+
+        # Create normalized state vector with one interleaved draw
+        state = rng.standard_normal(self.state_dim * 2).view(np.complex128)
         return state / np.linalg.norm(state)
         
-    def _apply_transformation(self, state: np.ndarray) -> np.ndarray:
-        """Apply quantum-inspired transformation"""
-        # Create random unitary matrix
-        unitary = self._random_unitary(self.state_dim)
-        return unitary @ state
-        
     def _random_unitary(self, dim: int) -> np.ndarray:
         """Generate random unitary matrix"""
         z = (np.random.randn(dim, dim) + 1j * np.random.randn(dim, dim)) / np.sqrt(2)
@@ -80,15 +105,10 @@ class SuperpositionGenerator:
         
     def _vary_word(self, word: str) -> str:
         """Create variation of a word"""
-        # Simple word variation logic
-        synonyms = {
-            "analyze": ["examine", "investigate", "study"],
-            "create": ["generate", "produce", "develop"],
-            "improve": ["enhance", "optimize", "upgrade"],
-            "error": ["issue", "problem", "bug"],
-            # Add more synonyms as needed
-        }
-        return np.random.choice(synonyms.get(word.lower(), [word]))
+        # stdlib random.choice on a tuple avoids numpy's per-call list
+        # validation and array conversion
+        synonyms = _SYNONYMS.get(word.lower())
+        return random.choice(synonyms) if synonyms else word
 
 class EntanglementManager:
     """Manages entanglement-like relationships between contexts"""
@@ -96,7 +116,12 @@ class EntanglementManager:
         self.config = config
         self.states: Dict[int, QuantumState] = {}
         self.entanglement_graph: Dict[int, List[int]] = {}
-        
+        # Flat CSR adjacency (indptr/indices), rebuilt lazily so
+        # traversals run over contiguous arrays instead of dict lookups
+        self._csr_dirty = True
+        self._indptr: Optional[np.ndarray] = None
+        self._indices: Optional[np.ndarray] = None
+
     def create_state(self, context: str) -> int:
         """Create new quantum state for context"""
         state_id = len(self.states)
@@ -107,6 +132,7 @@ class EntanglementManager:
         )
         self.states[state_id] = state
         self.entanglement_graph[state_id] = []
+        self._csr_dirty = True
         return state_id
         
     def entangle_states(self, state_id1: int, state_id2: int) -> None:
@@ -121,7 +147,8 @@ class EntanglementManager:
         # Update entanglement graph
         self.entanglement_graph[state_id1].append(state_id2)
         self.entanglement_graph[state_id2].append(state_id1)
-        
+        self._csr_dirty = True
+
         # Modify states to reflect entanglement
         self._apply_entanglement(state_id1, state_id2)
         
@@ -130,9 +157,12 @@ class EntanglementManager:
         state1 = self.states[state_id1]
         state2 = self.states[state_id2]
         
-        # Create entangled state vectors
-        combined_amplitude = (state1.amplitude + state2.amplitude) / np.sqrt(2)
-        combined_phase = (state1.phase + state2.phase) / 2
+        # Create entangled state vectors; pure real add/scale with an
+        # in-place rescale to avoid a second temporary per array
+        combined_amplitude = state1.amplitude + state2.amplitude
+        combined_amplitude *= 1.0 / np.sqrt(2)
+        combined_phase = state1.phase + state2.phase
+        combined_phase *= 0.5
         
         # Update both states
         state1.amplitude = combined_amplitude
@@ -142,42 +172,66 @@ class EntanglementManager:
         
     def propagate_changes(self, state_id: int, changes: np.ndarray) -> None:
         """Propagate changes through entangled states"""
-        visited = set()
-        
-        def propagate(current_id: int, change_vector: np.ndarray, depth: int = 0):
-            if depth > 2 or current_id in visited:  # Limit propagation depth
-                return
-                
-            visited.add(current_id)
-            current_state = self.states[current_id]
-            
-            # Apply changes with decay
-            decay_factor = 0.5 ** depth
-            current_state.amplitude += change_vector * decay_factor
-            
-            # Normalize
-            current_state.amplitude /= np.linalg.norm(current_state.amplitude)
-            
-            # Propagate to entangled states
-            for entangled_id in current_state.entangled_states:
-                if entangled_id not in visited:
-                    propagate(entangled_id, change_vector, depth + 1)
-                    
-        propagate(state_id, changes)
-        
+        # Level-order traversal with the decayed change vector scaled
+        # once per depth, so each node is a single in-place add instead
+        # of a recursion frame plus a fresh multiply allocation
+        visited = {state_id}
+        frontier = [state_id]
+
+        for decay_factor in (1.0, 0.5, 0.25):  # Limit propagation depth
+            if not frontier:
+                break
+            scaled = changes * decay_factor
+            next_frontier = []
+
+            for current_id in frontier:
+                current_state = self.states[current_id]
+                current_state.amplitude += scaled
+                current_state.amplitude /= np.linalg.norm(current_state.amplitude)
+
+                for entangled_id in current_state.entangled_states:
+                    if entangled_id not in visited:
+                        visited.add(entangled_id)
+                        next_frontier.append(entangled_id)
+
+            frontier = next_frontier
+        
+    def _rebuild_csr(self) -> None:
+        """Rebuild the flat CSR adjacency from the entanglement graph"""
+        counts = np.fromiter(
+            (len(self.entanglement_graph[i]) for i in range(len(self.entanglement_graph))),
+            dtype=np.int64,
+            count=len(self.entanglement_graph)
+        )
+        self._indptr = np.concatenate(([0], np.cumsum(counts)))
+        if counts.sum():
+            self._indices = np.concatenate([
+                np.asarray(self.entanglement_graph[i], dtype=np.int64)
+                for i in range(len(self.entanglement_graph))
+                if self.entanglement_graph[i]
+            ])
+        else:
+            self._indices = np.empty(0, dtype=np.int64)
+        self._csr_dirty = False
+
     def get_entangled_contexts(self, state_id: int) -> List[int]:
         """Get all contexts entangled with given state"""
-        visited = set()
-        result = []
-        
-        def traverse(current_id: int):
-            if current_id in visited:
-                return
-            visited.add(current_id)
-            result.append(current_id)
-            
-            for entangled_id in self.entanglement_graph[current_id]:
-                traverse(entangled_id)
-                
-        traverse(state_id)
+        if self._csr_dirty:
+            self._rebuild_csr()
+
+        # Iterative BFS over the CSR slices; no recursion-limit risk and
+        # no per-frame overhead on deep entanglement chains
+        seen = np.zeros(len(self.entanglement_graph), dtype=bool)
+        seen[state_id] = True
+        result = [state_id]
+        queue = deque([state_id])
+
+        while queue:
+            current = queue.popleft()
+            for neighbor in self._indices[self._indptr[current]:self._indptr[current + 1]]:
+                if not seen[neighbor]:
+                    seen[neighbor] = True
+                    result.append(int(neighbor))
+                    queue.append(neighbor)
+
         return result
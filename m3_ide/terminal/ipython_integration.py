@@ -1,13 +1,23 @@
 from IPython.core.magic import Magics, magics_class, line_magic, cell_magic
 from IPython.core.interactiveshell import InteractiveShell
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import ast
+import asyncio
+import atexit
 import json
+from functools import lru_cache
+import numpy as np
 from ..quantum.state_manager import EntanglementManager, SuperpositionGenerator
+from ..core.quantum_ops import seed_from_data
 from ..models.nemotron import NemotronModel
 from ..core.config import IDEConfig
 from ..quantum.advanced_operations import AdvancedQuantumOps
 
+@lru_cache(maxsize=64)
+def _parse_cached(source: str) -> ast.Module:
+    """Parse a cell, reusing the tree when identical source is re-run"""
+    return ast.parse(source)
+
 @magics_class
 class QuantumMagics(Magics):
     """Custom magic commands for quantum-enhanced IPython"""
@@ -21,6 +31,11 @@ class QuantumMagics(Magics):
         self.context_stack: List[int] = []
         self.quantum_ops = AdvancedQuantumOps(config.quantum_config)
         self.active_context = None
+        # One persistent loop for the AI magics; per-call asyncio.run
+        # would rebuild the loop and drop the model's keep-alive
+        # connections every invocation
+        self._loop = asyncio.new_event_loop()
+        atexit.register(self._loop.close)
 
     @line_magic
     def quantum_context(self, line: str) -> None:
@@ -78,8 +93,9 @@ class QuantumMagics(Magics):
             
         # Execute code and update quantum state
         try:
-            # Parse and execute code
-            tree = ast.parse(cell)
+            # Parse and execute code; repeat runs of the same cell reuse
+            # the cached tree
+            tree = _parse_cached(cell)
             result = self.shell.run_ast_nodes(tree.body, cell)
             
             # Update quantum state based on execution
@@ -151,9 +167,8 @@ class QuantumMagics(Magics):
                 print(completion)
             except Exception as e:
                 print(f"Error generating completion: {e}")
-                
-        import asyncio
-        asyncio.run(complete())
+
+        self._loop.run_until_complete(complete())
         
     @cell_magic
     def ai_transform(self, line: str, cell: str) -> None:
@@ -176,9 +191,8 @@ Transformed code:"""
                 print(result)
             except Exception as e:
                 print(f"Error transforming code: {e}")
-                
-        import asyncio
-        asyncio.run(transform())
+
+        self._loop.run_until_complete(transform())
         
     @line_magic
     def quantum_inspect(self, line: str) -> None:
@@ -208,16 +222,13 @@ Transformed code:"""
             
     def _compute_state_changes(self, result: Any) -> np.ndarray:
         """Compute quantum state changes from execution result"""
-        # Convert result to string representation
-        result_str = str(result)
-        
-        # Hash the result to create a change vector
-        import hashlib
-        hash_val = int(hashlib.sha256(result_str.encode()).hexdigest(), 16)
-        rng = np.random.RandomState(hash_val)
-        
+        # Hash the result to seed a change vector; a 64-bit non-crypto
+        # hash is plenty for PRNG seeding
+        hash_val = seed_from_data(result)
+        rng = np.random.default_rng(hash_val)
+
         # Create normalized change vector
-        changes = rng.randn(self.config.quantum.state_dim)
+        changes = rng.standard_normal(self.config.quantum.state_dim)
         return changes / np.linalg.norm(changes)
 
 class IPythonIntegration:
@@ -2,8 +2,7 @@ from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, TabbedContent, TabPane, TextArea, Tree
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.shortcuts import PromptSession
+from textual.message import Message
 from IPython.terminal.interactiveshell import TerminalInteractiveShell
 from IPython.core.magic import register_line_magic
 import asyncio
@@ -13,6 +12,25 @@ from ..core.config import IDEConfig
 from ..models.nemotron import NemotronModel
 from ..quantum.state_manager import EntanglementManager, SuperpositionGenerator
 
+class CommandTextArea(TextArea):
+    """Command box that submits on Enter instead of inserting a newline
+
+    TextArea consumes the Enter key itself (and stops the event) before
+    it can bubble to the app, so submission has to be intercepted here
+    on the widget.
+    """
+
+    class Submitted(Message):
+        """Posted when the user presses Enter in the command box"""
+
+    async def _on_key(self, event) -> None:
+        if event.key == "enter":
+            event.stop()
+            event.prevent_default()
+            self.post_message(self.Submitted())
+            return
+        await super()._on_key(event)
+
 class QuantumTerminal(App):
     """M3-optimized quantum terminal interface"""
     
@@ -31,8 +49,14 @@ class QuantumTerminal(App):
         self.entanglement = EntanglementManager(config.quantum)
         self.superposition = SuperpositionGenerator(config.quantum)
         self.ipython = self._setup_ipython()
-        self.session = PromptSession()
         self.current_context: Optional[int] = None
+        # Pending terminal output, flushed at most once per frame so
+        # bursty prints cost one re-render instead of one per line
+        self._out_buf: list = []
+        self._flush_scheduled = False
+        # IPython is not thread-safe across concurrent run_cell calls;
+        # serialize command execution behind one lock
+        self._run_lock = asyncio.Lock()
         
     def _setup_ipython(self) -> TerminalInteractiveShell:
         """Set up IPython shell with custom magics"""
@@ -69,7 +93,7 @@ class QuantumTerminal(App):
                     
                 with TabPane("Terminal", id="terminal"):
                     yield TextArea(id="terminal_output", read_only=True)
-                    yield TextArea(id="terminal_input", classes="input")
+                    yield CommandTextArea(id="terminal_input", classes="input")
                     
                 with TabPane("AI Assistant", id="ai"):
                     yield TextArea(id="ai_input")
@@ -79,41 +103,51 @@ class QuantumTerminal(App):
         
     async def on_mount(self) -> None:
         """Handle app mount"""
-        # Initialize file tree
+        # Initialize file tree; terminal commands run event-driven from
+        # the input widget rather than a polling kernel loop
         await self.populate_file_tree()
         
-        # Start IPython kernel
-        await self.start_ipython_kernel()
-        
     async def populate_file_tree(self) -> None:
         """Populate the file tree"""
         tree = self.query_one("#file_tree", Tree)
         # Add file watching and population logic here
         
-    async def start_ipython_kernel(self) -> None:
-        """Start IPython kernel in background"""
+    def write_terminal_output(self, text: str) -> None:
+        """Queue terminal output, flushing at most once per 16 ms"""
+        self._out_buf.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.set_timer(0.016, self._flush_output)
+
+    def _flush_output(self) -> None:
+        """Insert all buffered output in one widget update"""
+        self._flush_scheduled = False
+        if not self._out_buf:
+            return
         terminal = self.query_one("#terminal_output", TextArea)
-        
-        async def kernel_loop():
-            while True:
-                try:
-                    # Get input
-                    terminal_input = self.query_one("#terminal_input", TextArea)
-                    command = await self.session.prompt_async()
-                    
-                    # Execute in IPython
-                    result = self.ipython.run_cell(command)
-                    
-                    # Update output
-                    if result.result is not None:
-                        terminal.insert_text_at_cursor(f"\n{result.result}")
-                        
-                except Exception as e:
-                    terminal.insert_text_at_cursor(f"\nError: {e}")
-                    
-                await asyncio.sleep(0.1)
-                
-        asyncio.create_task(kernel_loop())
+        terminal.insert_text_at_cursor("".join(self._out_buf))
+        self._out_buf.clear()
+
+    async def run_terminal_command(self) -> None:
+        """Execute the pending terminal input in IPython"""
+        terminal_input = self.query_one("#terminal_input", TextArea)
+        command = terminal_input.text.strip()
+        if not command:
+            return
+        terminal_input.text = ""
+
+        try:
+            # run_cell is synchronous; keep it off the UI event loop,
+            # one command at a time
+            async with self._run_lock:
+                result = await asyncio.to_thread(self.ipython.run_cell, command)
+
+            # Update output
+            if result.result is not None:
+                self.write_terminal_output(f"\n{result.result}")
+
+        except Exception as e:
+            self.write_terminal_output(f"\nError: {e}")
         
     async def handle_quantum_magic(self, line: str) -> Any:
         """Handle quantum magic commands"""
@@ -173,6 +207,10 @@ class QuantumTerminal(App):
         # Implement command palette UI
         pass
         
+    async def on_command_text_area_submitted(self, message: CommandTextArea.Submitted) -> None:
+        """Run the pending terminal input when the command box submits"""
+        await self.run_terminal_command()
+
     def on_key(self, event) -> None:
         """Handle key events"""
         # Implement Vim-like keybindings
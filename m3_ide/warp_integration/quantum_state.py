@@ -1,5 +1,6 @@
+import json
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import numpy as np
 from enum import Enum
 
@@ -14,11 +15,13 @@ class QuantumState:
         self.quantum_memory: Dict[str, np.ndarray] = {}
         self.reality_metrics: Dict[str, float] = {}
         self.metal_context: Dict[str, Any] = {}
+        self._serialized: Optional[str] = None
 
     def update_from_result(self, result: Any) -> None:
         """Update quantum state based on command result."""
         self.reality_metrics["coherence"] = self._calculate_coherence()
         self._update_metal_context()
+        self._serialized = None
 
     def _calculate_coherence(self) -> float:
         """Calculate quantum state coherence."""
@@ -34,21 +37,35 @@ class QuantumState:
 
     def serialize(self) -> str:
         """Serialize quantum state for export."""
-        return str(self.__dict__)
+        # Cached until the state changes; environment exports cannot
+        # carry numpy arrays, so quantum_memory stays out of the payload
+        if self._serialized is None:
+            self._serialized = json.dumps(
+                {
+                    "state": self.current_state.value,
+                    "metrics": self.reality_metrics,
+                    "metal_context": self.metal_context,
+                },
+                separators=(",", ":")
+            )
+        return self._serialized
 
 
 class QuantumVisualization:
     def __init__(self):
         self.display_mode: str = "terminal"
-        self.color_scheme: Dict[str, str] = {
-            "superposition": "\033[38;5;99m",
-            "entangled": "\033[38;5;207m",
-            "collapsed": "\033[38;5;51m"
+        # Keyed by the enum member itself and pre-encoded, so a render
+        # is one identity-hash lookup with no .value string hash or
+        # stdout re-encoding
+        self.color_scheme: Dict[QuantumState.StateType, bytes] = {
+            QuantumState.StateType.SUPERPOSITION: b"\x1b[38;5;99m",
+            QuantumState.StateType.ENTANGLED: b"\x1b[38;5;207m",
+            QuantumState.StateType.COLLAPSED: b"\x1b[38;5;51m"
         }
 
     def update_display(self, state: QuantumState) -> None:
         """Update terminal visualization based on quantum state."""
-        color = self.color_scheme[state.current_state.value]
+        color = self.color_scheme[state.current_state]
         # Terminal visualization implementation here
 
     def generate_mermaid(self, state: QuantumState) -> str:
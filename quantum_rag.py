@@ -1,4 +1,8 @@
+import hashlib
 import os
+import sqlite3
+import threading
+import time
 from typing import List, Dict, Any
 import numpy as np
 from dataclasses import dataclass
@@ -10,6 +14,21 @@ from langchain.llms import HuggingFaceHub
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to vectorized NumPy
+    njit = None
+
+def _quantum_overlap(state1: np.ndarray, state2: np.ndarray) -> float:
+    """Mean overlap of two equal-length packed complex states"""
+    total = 0.0
+    for i in range(state1.shape[0]):
+        total += abs(state1[i] * np.conj(state2[i]))
+    return total / state1.shape[0]
+
+if njit is not None:
+    _quantum_overlap = njit(cache=True, fastmath=True)(_quantum_overlap)
+
 @dataclass
 class QuantumState:
     """Represents a quantum state with amplitude and phase"""
@@ -26,44 +45,44 @@ class QuantumEmbedding:
         self.quantum_dim = quantum_dim
         self.embeddings = HuggingFaceEmbeddings(model_name="BAAI/bge-small-en-v1.5")
         
-    def create_quantum_state(self, embedding: List[float]) -> List[QuantumState]:
-        """Convert classical embedding to quantum state"""
-        # Normalize the embedding
-        norm = np.linalg.norm(embedding)
+    def create_quantum_state(self, embedding: List[float]) -> np.ndarray:
+        """Convert classical embedding to a packed quantum state array
+
+        Consecutive value pairs become the real/imag parts of one
+        complex128 amplitude, so the whole conversion is a handful of
+        vectorized ops rather than a Python loop boxing per-pair
+        QuantumState objects. An odd trailing value becomes a real
+        amplitude.
+        """
+        emb = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(emb)
         if norm > 0:
-            embedding = [x / norm for x in embedding]
-            
-        # Create quantum states
-        quantum_states = []
-        for i in range(0, len(embedding), 2):
-            if i + 1 < len(embedding):
-                # Use pairs of values for amplitude and phase
-                amplitude = np.sqrt(embedding[i]**2 + embedding[i+1]**2)
-                phase = np.arctan2(embedding[i+1], embedding[i])
-            else:
-                # Handle odd length by using single value
-                amplitude = abs(embedding[i])
-                phase = np.angle(complex(embedding[i], 0))
-                
-            quantum_states.append(QuantumState(amplitude, phase))
-            
-        return quantum_states
-        
-    def quantum_similarity(self, state1: List[QuantumState], state2: List[QuantumState]) -> float:
+            emb = emb / norm
+
+        n = emb.size & ~1
+        state = (emb[:n:2] + 1j * emb[1:n:2]).astype(np.complex64)
+        if emb.size & 1:
+            state = np.concatenate([state, emb[-1:].astype(np.complex64)])
+        return state
+
+    def quantum_similarity(self, state1: np.ndarray, state2: np.ndarray) -> float:
         """Calculate quantum state overlap (fidelity)"""
-        overlap = 0
-        min_len = min(len(state1), len(state2))
-        
-        for i in range(min_len):
-            # Calculate quantum state overlap using complex amplitudes
-            c1 = state1[i].to_complex()
-            c2 = state2[i].to_complex()
-            overlap += abs(c1 * np.conj(c2))
-            
-        return overlap / min_len
+        min_len = min(state1.shape[0], state2.shape[0])
+        if njit is not None:
+            # Fused JIT loop: no product/abs temporaries
+            return float(_quantum_overlap(state1[:min_len], state2[:min_len]))
+        # Overlap of the packed complex states in one vectorized pass
+        return float(
+            np.mean(np.abs(state1[:min_len] * np.conj(state2[:min_len])))
+        )
 
 class QuantumRAG:
     """Quantum-enhanced RAG system"""
+
+    # Rows kept in the on-disk query-embedding cache before the least
+    # recently used entries are evicted
+    QCACHE_MAX_ROWS = 1024
+
     def __init__(self, hf_api_key: str):
         self.hf_api_key = hf_api_key
         os.environ["HUGGINGFACEHUB_API_TOKEN"] = hf_api_key
@@ -75,6 +94,27 @@ class QuantumRAG:
             chunk_overlap=200
         )
         self.vectorstore = None
+        # page_content -> packed complex64 quantum state, filled at
+        # index time
+        self._doc_states: Dict[str, np.ndarray] = {}
+        # SQLite-backed LRU query embedding cache; repeat questions skip
+        # the tokenize+forward pass entirely. check_same_thread is off
+        # because callers may run in a threadpool; the lock serializes
+        # access to the shared connection
+        self._qcache = sqlite3.connect(".quantum_qcache.db", check_same_thread=False)
+        self._qcache_lock = threading.Lock()
+        self._qcache.execute(
+            "CREATE TABLE IF NOT EXISTS query_embeddings "
+            "(hash TEXT PRIMARY KEY, emb BLOB, last_used REAL)"
+        )
+        # Caches written before the LRU column existed lack last_used
+        columns = [row[1] for row in self._qcache.execute(
+            "PRAGMA table_info(query_embeddings)"
+        )]
+        if "last_used" not in columns:
+            self._qcache.execute(
+                "ALTER TABLE query_embeddings ADD COLUMN last_used REAL DEFAULT 0"
+            )
         self.llm = HuggingFaceHub(
             repo_id="mistralai/Mistral-7B-Instruct-v0.3",
             huggingfacehub_api_token=hf_api_key
@@ -100,6 +140,13 @@ Answer:""",
         documents = loader.load()
         return self.text_splitter.split_documents(documents)
         
+    def _pack_states(self, embeddings: List[List[float]]) -> np.ndarray:
+        """Pack normalized embeddings into (n, d//2) complex64 rows"""
+        embs = np.asarray(embeddings, dtype=np.float32)
+        embs /= np.linalg.norm(embs, axis=1, keepdims=True)
+        n = embs.shape[1] & ~1
+        return (embs[:, :n:2] + 1j * embs[:, 1:n:2]).astype(np.complex64)
+
     def index_documents(self, documents: List[Any]) -> None:
         """Index documents with quantum-enhanced embeddings"""
         # Create classical embeddings first
@@ -107,32 +154,92 @@ Answer:""",
             documents,
             self.quantum_embeddings.embeddings
         )
-        
+
+        # Precompute the packed quantum states for the corpus in one
+        # contiguous complex64 matrix so retrieval never re-embeds
+        # candidates; 8 bytes per pair versus a boxed object per pair
+        texts = [doc.page_content for doc in documents]
+        if texts:
+            states = self._pack_states(
+                self.quantum_embeddings.embeddings.embed_documents(texts)
+            )
+            self._doc_states = dict(zip(texts, states))
+
+    def _embed_query_cached(self, query: str) -> np.ndarray:
+        """Embed a query, serving repeats from the SQLite LRU cache"""
+        key = hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+        with self._qcache_lock:
+            row = self._qcache.execute(
+                "SELECT emb FROM query_embeddings WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._qcache.execute(
+                    "UPDATE query_embeddings SET last_used = ? WHERE hash = ?",
+                    (time.time(), key)
+                )
+                self._qcache.commit()
+                return np.frombuffer(row[0], dtype=np.float32)
+
+        # Embed outside the lock; the forward pass is the slow part
+        embedding = np.asarray(
+            self.quantum_embeddings.embeddings.embed_query(query),
+            dtype=np.float32
+        )
+        with self._qcache_lock:
+            self._qcache.execute(
+                "INSERT OR REPLACE INTO query_embeddings VALUES (?, ?, ?)",
+                (key, embedding.tobytes(), time.time())
+            )
+            # Evict the least recently used rows beyond the cap
+            self._qcache.execute(
+                "DELETE FROM query_embeddings WHERE hash IN ("
+                "SELECT hash FROM query_embeddings "
+                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.QCACHE_MAX_ROWS,)
+            )
+            self._qcache.commit()
+        return embedding
+
     def quantum_retrieval(self, query: str, k: int = 4) -> List[Any]:
         """Retrieve documents using quantum similarity"""
         if not self.vectorstore:
             raise ValueError("No documents indexed yet")
-            
-        # Get classical embeddings
-        query_embedding = self.quantum_embeddings.embeddings.embed_query(query)
-        
+
+        # Get classical embeddings, via the persistent cache when the
+        # same query has been asked before
+        query_embedding = self._embed_query_cached(query)
+
         # Convert to quantum state
         query_state = self.quantum_embeddings.create_quantum_state(query_embedding)
-        
+
         # Get initial candidates using classical similarity
         docs_and_scores = self.vectorstore.similarity_search_with_score(query, k=k*2)
-        
-        # Re-rank using quantum similarity
-        quantum_scores = []
-        for doc, _ in docs_and_scores:
-            doc_embedding = self.quantum_embeddings.embeddings.embed_documents([doc.page_content])[0]
-            doc_state = self.quantum_embeddings.create_quantum_state(doc_embedding)
-            quantum_score = self.quantum_embeddings.quantum_similarity(query_state, doc_state)
-            quantum_scores.append((doc, quantum_score))
-            
-        # Sort by quantum similarity and take top k
-        quantum_scores.sort(key=lambda x: x[1], reverse=True)
-        return [doc for doc, _ in quantum_scores[:k]]
+        if not docs_and_scores:
+            return []
+
+        # Look candidates up in the precomputed state table; anything
+        # missing (indexed outside index_documents) is embedded in one
+        # batched call and cached
+        texts = [doc.page_content for doc, _ in docs_and_scores]
+        missing = [text for text in texts if text not in self._doc_states]
+        if missing:
+            states = self._pack_states(
+                self.quantum_embeddings.embeddings.embed_documents(missing)
+            )
+            self._doc_states.update(zip(missing, states))
+
+        doc_states = np.stack([self._doc_states[text] for text in texts])
+        min_len = min(query_state.shape[0], doc_states.shape[1])
+        scores = np.mean(
+            np.abs(doc_states[:, :min_len] * np.conj(query_state[:min_len])),
+            axis=1
+        )
+
+        # Partial partition for the top k; order the winners afterwards
+        k = min(k, scores.shape[0])
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [docs_and_scores[i][0] for i in top]
         
     def answer_question(self, question: str) -> str:
         """Answer a question using quantum-enhanced RAG"""
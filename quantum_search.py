@@ -1,7 +1,8 @@
 import numpy as np
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 import os
-import glob
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 @dataclass
@@ -12,45 +13,67 @@ class CodeFragment:
     end_line: int
     perplexity: float
     relevance: float = field(default=None)
+    # Lowercased token set, derived once at index time so every search
+    # scores against cached sets instead of re-splitting the content
+    tokens: frozenset = field(default=None)
+
+_SKIP_DIRS = frozenset({'__pycache__', '.git', 'node_modules', '.venv', 'venv'})
+
+def _scan(directory: str, extensions: tuple) -> Iterator[str]:
+    """Yield matching file paths in one scandir sweep per directory
+
+    DirEntry caches the file type from the directory read itself, so
+    there is no per-entry stat and no per-extension re-walk the way
+    repeated recursive glob calls incur.
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS and not entry.name.startswith('.'):
+                    yield from _scan(entry.path, extensions)
+            elif entry.is_file(follow_symlinks=False) and entry.name.endswith(extensions):
+                yield entry.path
 
 class QuantumPerplexitySearch:
     def __init__(self):
         self.code_cache: Dict[str, List[CodeFragment]] = {}
+        # Inverted index: token -> ids of fragments containing it, so a
+        # search only scores fragments that can have a non-zero score
+        self.fragments: List[CodeFragment] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
         
     def calculate_perplexity(self, code: str) -> float:
         """Calculate perplexity score for a code fragment"""
         tokens = code.split()
         if not tokens:
             return float('inf')
-            
-        # Simple perplexity calculation based on token frequencies
-        frequencies = {}
-        for token in tokens:
-            frequencies[token] = frequencies.get(token, 0) + 1
-            
-        probabilities = [frequencies[token] / len(tokens) for token in tokens]
-        log_probs = np.log(probabilities)
-        perplexity = np.exp(-np.mean(log_probs))
-        
-        return perplexity
-        
-    def calculate_relevance(self, content: str, query: str) -> float:
-        """Calculate relevance score between content and query"""
-        # Convert to lowercase for case-insensitive matching
-        content_lower = content.lower()
-        query_lower = query.lower()
-        
-        # Split into words
-        content_words = set(content_lower.split())
-        query_words = set(query_lower.split())
+
+        # Simple perplexity calculation based on token frequencies.
+        # Each token contributes -log(count/N) weighted by its count, so
+        # the mean log-prob reduces to log(N) - sum(c*log(c))/N over the
+        # unique counts; no per-token probability list is built
+        counts = np.fromiter(
+            Counter(tokens).values(), dtype=np.int64, count=-1
+        )
+        n = counts.sum()
+        return float(np.exp(np.log(n) - (counts * np.log(counts)).sum() / n))
         
+    QUANTUM_TERMS = frozenset(
+        {'quantum', 'qubit', 'superposition', 'entanglement', 'state', 'vector', 'amplitude'}
+    )
+
+    def calculate_relevance(self, content_words: frozenset, query_words: frozenset) -> float:
+        """Calculate relevance score between cached token sets"""
         # Calculate word overlap
         common_words = content_words.intersection(query_words)
-        
+
         # Calculate quantum-specific relevance
-        quantum_terms = {'quantum', 'qubit', 'superposition', 'entanglement', 'state', 'vector', 'amplitude'}
-        quantum_relevance = len(content_words.intersection(quantum_terms)) / len(quantum_terms)
-        
+        quantum_relevance = len(content_words.intersection(self.QUANTUM_TERMS)) / len(self.QUANTUM_TERMS)
+
         # Combine word overlap and quantum relevance
         overlap_score = len(common_words) / (len(query_words) + 0.1)  # Add small constant to avoid division by zero
         return (overlap_score + quantum_relevance) / 2
@@ -64,57 +87,83 @@ class QuantumPerplexitySearch:
             path=path,
             start_line=start_line,
             end_line=end_line,
-            perplexity=perplexity
+            perplexity=perplexity,
+            tokens=frozenset(content.lower().split())
         )
         
         if path not in self.code_cache:
             self.code_cache[path] = []
         self.code_cache[path].append(fragment)
-        
+
+        fragment_id = len(self.fragments)
+        self.fragments.append(fragment)
+        for token in fragment.tokens:
+            self.postings[token].append(fragment_id)
+
         return fragment
         
+    def _read_and_chunk(self, file_path: str) -> tuple:
+        """Read one file and split it into 50-line chunks
+
+        Runs on a worker thread: read() releases the GIL during the
+        syscall, so reads overlap across files. Returns
+        (path, [(start_line, end_line, text), ...]).
+        """
+        chunks = []
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                lines = f.read().splitlines()
+        except Exception as e:
+            print(f"Error indexing {file_path}: {e}")
+            return file_path, chunks
+
+        chunk_size = 50
+        for i in range(0, len(lines), chunk_size):
+            chunk = '\n'.join(lines[i:i + chunk_size])
+            if chunk.strip():  # Skip empty chunks
+                chunks.append((i + 1, min(i + chunk_size, len(lines)), chunk))
+        return file_path, chunks
+
     def index_directory(self, directory: str, file_types: Optional[List[str]] = None) -> None:
         """Index all code files in a directory"""
         if file_types is None:
             file_types = ['.py', '.ts', '.js']
-            
-        for file_type in file_types:
-            pattern = os.path.join(directory, f'**/*{file_type}')
-            for file_path in glob.glob(pattern, recursive=True):
-                if os.path.isfile(file_path) and not os.path.islink(file_path):
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = f.readlines()
-                            
-                            # Skip empty files
-                            if not lines:
-                                continue
-                                
-                            # Index file in chunks
-                            chunk_size = 50
-                            for i in range(0, len(lines), chunk_size):
-                                chunk = ''.join(lines[i:i + chunk_size])
-                                if chunk.strip():  # Skip empty chunks
-                                    self.index_code(
-                                        content=chunk,
-                                        path=file_path,
-                                        start_line=i + 1,
-                                        end_line=min(i + chunk_size, len(lines))
-                                    )
-                    except Exception as e:
-                        print(f"Error indexing {file_path}: {e}")
+
+        paths = list(_scan(directory, tuple(file_types)))
+
+        # Indexing is I/O-bound: overlap the reads on a thread pool
+        # (bounded well under typical fd limits) and keep the cache and
+        # posting-list mutation on this thread so no locks are needed
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            for file_path, chunks in executor.map(self._read_and_chunk, paths):
+                for start_line, end_line, chunk in chunks:
+                    self.index_code(
+                        content=chunk,
+                        path=file_path,
+                        start_line=start_line,
+                        end_line=end_line
+                    )
                         
     def search(self, query: str, min_perplexity: float = 0, max_perplexity: float = float('inf')) -> List[CodeFragment]:
         """Search for code using perplexity scores and quantum relevance"""
         results = []
-        
-        for fragments in self.code_cache.values():
-            for fragment in fragments:
-                if min_perplexity <= fragment.perplexity <= max_perplexity:
-                    relevance = self.calculate_relevance(fragment.content, query)
-                    if relevance > 0.1:  # Adjustable threshold
-                        fragment.relevance = relevance  # Add relevance score to fragment
-                        results.append(fragment)
+        query_words = frozenset(query.lower().split())
+
+        # Union the posting lists for the query tokens plus the quantum
+        # terms: any fragment outside that set scores exactly zero, so
+        # the full scan collapses to the candidates that can match
+        candidate_ids = set().union(
+            *(self.postings.get(word, ())
+              for word in query_words | self.QUANTUM_TERMS)
+        )
+
+        for fragment_id in candidate_ids:
+            fragment = self.fragments[fragment_id]
+            if min_perplexity <= fragment.perplexity <= max_perplexity:
+                relevance = self.calculate_relevance(fragment.tokens, query_words)
+                if relevance > 0.1:  # Adjustable threshold
+                    fragment.relevance = relevance  # Add relevance score to fragment
+                    results.append(fragment)
                         
         # Sort by relevance score
         results.sort(key=lambda x: x.relevance, reverse=True)
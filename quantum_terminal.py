@@ -14,88 +14,44 @@ import asyncio
 from datetime import datetime
 
 class SystemMetrics(Static):
-    def __init__(self):
-        super().__init__()
-        self.update_task = None
-
-    def on_mount(self):
-        self.update_task = asyncio.create_task(self._update_metrics())
+    """Sidebar system metrics; fed by the app's shared sidebar tick."""
 
-    async def _update_metrics(self):
-        while True:
-            metrics = {
-                "cpu": psutil.cpu_percent(),
-                "memory": psutil.virtual_memory().percent,
-                "disk": psutil.disk_usage("/").percent
-            }
-            self.update(
-                f"[bold]System Metrics[/]\n"
-                f"CPU: {metrics['cpu']:.1f}%\n"
-                f"Memory: {metrics['memory']:.1f}%\n"
-                f"Disk: {metrics['disk']:.1f}%"
-            )
-            await asyncio.sleep(1)
+    def show_metrics(self, cpu: float, memory: float, disk: float) -> None:
+        self.update(
+            f"[bold]System Metrics[/]\n"
+            f"CPU: {cpu:.1f}%\n"
+            f"Memory: {memory:.1f}%\n"
+            f"Disk: {disk:.1f}%"
+        )
 
 class ResourceMonitor(Static):
+    """Sidebar resource display; fed by the app's shared sidebar tick."""
+
     def __init__(self, resource_manager: ResourceManager = None, **kwargs):
         super().__init__(**kwargs)
         self.resource_manager = resource_manager
-        self.update_task = None
-    
-    async def on_mount(self) -> None:
-        """Start the update task when mounted."""
-        self.update_task = asyncio.create_task(self._update_display())
-    
-    async def on_unmount(self) -> None:
-        """Cancel the update task when unmounted."""
-        if self.update_task:
-            self.update_task.cancel()
-            try:
-                await self.update_task
-            except asyncio.CancelledError:
-                pass
-    
-    async def _update_display(self) -> None:
-        """Update the display periodically."""
-        while True:
-            try:
-                if self.resource_manager:
-                    metrics = await self.resource_manager.get_resource_metrics()
-                    
-                    # Format display text
-                    text = f"[b]System Resources[/b]\n"
-                    text += f"CPU: {metrics.get('cpu_percent', 0):.1f}%\n"
-                    text += f"Memory: {metrics.get('memory_percent', 0):.1f}%\n"
-                    text += f"Used: {metrics.get('memory_used', 0) / (1024**3):.2f} GB\n"
-                    text += f"Total: {metrics.get('memory_total', 0) / (1024**3):.2f} GB"
-                    
-                    self.update(text)
-                
-                await asyncio.sleep(2)  # Update every 2 seconds
-            except Exception as e:
-                logging.error(f"Error updating resource display: {e}")
-                await asyncio.sleep(5)  # Wait before retrying
 
-class ServiceStatus(Static):
-    def __init__(self):
-        super().__init__()
-        self.update_task = None
+    def show_metrics(self, metrics: dict) -> None:
+        text = f"[b]System Resources[/b]\n"
+        text += f"CPU: {metrics.get('cpu_percent', 0):.1f}%\n"
+        text += f"Memory: {metrics.get('memory_percent', 0):.1f}%\n"
+        text += f"Used: {metrics.get('memory_used', 0) / (1024**3):.2f} GB\n"
+        text += f"Total: {metrics.get('memory_total', 0) / (1024**3):.2f} GB"
+        self.update(text)
 
-    def on_mount(self):
-        self.update_task = asyncio.create_task(self._update_status())
+class ServiceStatus(Static):
+    """Sidebar service status; fed by the app's shared sidebar tick."""
 
-    async def _update_status(self):
-        while True:
-            services = {
-                "Quantum Engine": "Running",
-                "M3 Neural Engine": "Active",
-                "Resource Manager": "Monitoring"
-            }
-            self.update(
-                f"[bold]Service Status[/]\n" +
-                "\n".join(f"{name}: {status}" for name, status in services.items())
-            )
-            await asyncio.sleep(5)
+    def show_status(self) -> None:
+        services = {
+            "Quantum Engine": "Running",
+            "M3 Neural Engine": "Active",
+            "Resource Manager": "Monitoring"
+        }
+        self.update(
+            f"[bold]Service Status[/]\n" +
+            "\n".join(f"{name}: {status}" for name, status in services.items())
+        )
 
 class ProcessViewer(Static):
     """Interactive process viewer with real-time insights."""
@@ -299,23 +255,76 @@ class QuantumTerminal(App):
         super().__init__(*args, **kwargs)
         self.resource_manager = None
         self.scaffold = None
-    
+        self.sidebar_task = None
+        # Set by action_refresh to wake the sidebar tick immediately
+        self._refresh_event = asyncio.Event()
+
     async def on_mount(self) -> None:
         """Initialize after terminal is mounted."""
         # Initialize resource manager
         self.resource_manager = await ResourceManager().start()
         self.scaffold = QuantumScaffold()
-        
+
         # Register terminal process
         await self.resource_manager.register_process(
             os.getpid(),
             "quantum_terminal",
             ResourcePriority.HIGH
         )
-        
+
         # Initialize components that need resource manager
         resource_monitor = self.query_one("#resource-monitor")
         resource_monitor.resource_manager = self.resource_manager
+
+        # One shared tick drives all three sidebar widgets; the old
+        # per-widget loops each woke the event loop on their own
+        # schedule and re-read /proc separately
+        self.sidebar_task = asyncio.create_task(self._update_sidebar())
+
+    @staticmethod
+    def _snapshot() -> tuple:
+        """One psutil pass for everything the sidebar shows
+
+        interval=None makes cpu_percent non-blocking: it diffs against
+        the counters cached from the previous tick instead of sleeping
+        inside the call.
+        """
+        return (
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory().percent,
+            psutil.disk_usage("/").percent
+        )
+
+    async def _update_sidebar(self) -> None:
+        """Refresh the sidebar widgets from one snapshot per tick."""
+        tick = 0
+        while True:
+            try:
+                cpu, memory, disk = await asyncio.to_thread(self._snapshot)
+                self.query_one(SystemMetrics).show_metrics(cpu, memory, disk)
+
+                # Resource manager metrics every 2 s, status every 5 s,
+                # matching the old per-widget cadences
+                if tick % 2 == 0 and self.resource_manager:
+                    metrics = await self.resource_manager.get_resource_metrics()
+                    self.query_one(ResourceMonitor).show_metrics(metrics)
+                if tick % 5 == 0:
+                    self.query_one(ServiceStatus).show_status()
+
+                tick += 1
+                # Sleep until the next tick, or immediately when a
+                # manual refresh is requested
+                try:
+                    await asyncio.wait_for(self._refresh_event.wait(), timeout=1.0)
+                    self._refresh_event.clear()
+                    tick = 0  # Refresh everything, not just the fast metrics
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Error updating sidebar: {e}")
+                await asyncio.sleep(5)  # Wait before retrying
     
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -335,33 +344,22 @@ class QuantumTerminal(App):
         yield Footer()
     
     async def on_unmount(self) -> None:
+        if self.sidebar_task:
+            self.sidebar_task.cancel()
+            try:
+                await self.sidebar_task
+            except asyncio.CancelledError:
+                pass
         if self.resource_manager:
             await self.resource_manager.unregister_process(os.getpid())
     
     def action_refresh(self) -> None:
-        """Refresh all metrics and status displays"""
-        try:
-            # Update system metrics
-            metrics = self.query_one(SystemMetrics)
-            if metrics and metrics.update_task:
-                metrics.update_task.cancel()
-            new_metrics = SystemMetrics()
-            new_metrics.add_class("metrics")
-            metrics.remove()
-            self.query_one("#sidebar").mount(new_metrics)
-            
-            # Update service status
-            status = self.query_one(ServiceStatus)
-            if status and status.update_task:
-                status.update_task.cancel()
-            new_status = ServiceStatus()
-            new_status.add_class("status")
-            status.remove()
-            self.query_one("#sidebar").mount(new_status)
-            
-        except Exception as e:
-            log = self.query_one(Log)
-            log.write(f"[red]Error refreshing: {str(e)}[/]")
+        """Refresh all metrics and status displays
+
+        Wakes the sidebar tick early; the widgets are reused in place
+        instead of being torn down and remounted.
+        """
+        self._refresh_event.set()
 
 if __name__ == "__main__":
     app = QuantumTerminal()
@@ -1,4 +1,5 @@
 from fastapi import FastAPI, BackgroundTasks, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
@@ -29,16 +30,21 @@ async def lifespan(app: FastAPI):
     metal_config = MetalConfig()
     accelerator = MetalAccelerator(metal_config)
     pipeline = PipelineOrchestrator()
-    
+
+    # Warm the default local pipeline in the background so the first
+    # request does not pay the model-load latency
+    warmup = asyncio.create_task(pipeline.warmup())
+
     try:
         yield
     finally:
         # Cleanup
+        warmup.cancel()
         if resource_manager:
             for pid in list(resource_manager.processes.keys()):
                 await resource_manager.unregister_process(pid)
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Configure CORS
 app.add_middleware(
@@ -129,7 +135,10 @@ async def process_pipeline(request: PipelineRequest):
     """
     try:
         result = await pipeline.process(request)
-        return result
+        # Return the response directly: jsonable_encoder cannot handle
+        # the embeddings ndarray, while orjson's OPT_SERIALIZE_NUMPY
+        # serializes it without boxing each float
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,9 +1,10 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, List
 from quantum_rag import QuantumRAG, RealityMetrics, MetalConfig
 
-app = FastAPI(title="Cortex API Server")
+app = FastAPI(title="Cortex API Server", default_response_class=ORJSONResponse)
 
 # Initialize Quantum RAG with Metal acceleration
 metal_config = MetalConfig(
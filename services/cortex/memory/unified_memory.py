@@ -1,6 +1,7 @@
 """
 Unified Memory Management for M3 Architecture
 """
+import time
 import torch
 import numpy as np
 from typing import Dict, Optional, Any
@@ -8,7 +9,6 @@ import threading
 import weakref
 import logging
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,6 @@ class UnifiedMemoryManager:
         self.max_memory = max_memory_gb * 1024 * 1024 * 1024  # Convert to bytes
         self.allocated_regions: Dict[int, MemoryRegion] = {}
         self.lock = threading.Lock()
-        self._cleanup_executor = ThreadPoolExecutor(max_workers=1)
         self.device = torch.device("mps" if torch.backends.mps.is_available() else "cpu")
     
     def allocate(self, size: int, priority: int = 0) -> Optional[int]:
@@ -54,15 +53,13 @@ class UnifiedMemoryManager:
                 del self.allocated_regions[region_id]
     
     def _cleanup_low_priority(self):
-        """Clean up low priority allocations"""
-        with self.lock:
-            to_remove = []
-            for region_id, region in self.allocated_regions.items():
-                if not region.in_use and region.priority < 1:
-                    to_remove.append(region_id)
-            
-            for region_id in to_remove:
-                self.free(region_id)
+        """Clean up low priority allocations (caller holds the lock)"""
+        to_remove = [
+            region_id for region_id, region in self.allocated_regions.items()
+            if not region.in_use and region.priority < 1
+        ]
+        for region_id in to_remove:
+            del self.allocated_regions[region_id]
     
     def _get_total_allocated(self) -> int:
         """Get total allocated memory"""
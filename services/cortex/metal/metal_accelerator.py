@@ -10,12 +10,13 @@ class MetalConfig:
     max_sequence_length: int = 2048
     quantization_bits: int = 8
     attention_heads: int = 8
+    precision: str = "fp16"  # activation precision on MPS: "fp16" or "fp32"
 
 class MetalAccelerator:
     def __init__(self, config: Optional[MetalConfig] = None):
         self.config = config or MetalConfig()
         self.device = torch.device(self.config.device)
-        
+
     def prepare_model(self, model: torch.nn.Module) -> torch.nn.Module:
         """Optimize model for Metal execution"""
         model = model.to(self.device)
@@ -27,39 +28,51 @@ class MetalAccelerator:
     
     def prepare_embeddings(self, embeddings: np.ndarray) -> torch.Tensor:
         """Convert embeddings to Metal-optimized format"""
-        return torch.from_numpy(embeddings).to(self.device)
+        # from_numpy wraps the host buffer zero-copy; only the single
+        # device upload remains, issued without blocking the host
+        tensor = torch.from_numpy(np.ascontiguousarray(embeddings))
+        return tensor.to(self.device, non_blocking=True)
     
     def batch_process(self, inputs: List[torch.Tensor]) -> List[torch.Tensor]:
         """Process inputs in optimized batches"""
-        batches = [inputs[i:i + self.config.batch_size] 
-                  for i in range(0, len(inputs), self.config.batch_size)]
-        
+        if not inputs:
+            return []
+
+        # One host-to-device copy for the whole workload; the per-batch
+        # loop then stays on-device so the Metal queue is fed without an
+        # intermediate sync per batch
+        stacked = torch.stack(inputs).to(self.device)
+
+        # Run activations in half precision on MPS to halve memory
+        # traffic on this bandwidth-bound path
+        if self.device.type == "mps" and self.config.precision == "fp16":
+            stacked = stacked.half()
+
         results = []
-        for batch in batches:
-            batch_tensor = torch.stack(batch).to(self.device)
-            with torch.no_grad():
-                result = self._process_batch(batch_tensor)
-            results.extend(result)
-        
+        with torch.no_grad():
+            for batch in torch.split(stacked, self.config.batch_size):
+                results.extend(self._process_batch(batch))
+
         return results
     
     def _process_batch(self, batch: torch.Tensor) -> List[torch.Tensor]:
         """Internal batch processing with Metal optimization"""
-        # Apply attention mechanism
         batch_size, seq_length, hidden_size = batch.shape
-        attention_mask = torch.ones(batch_size, seq_length).to(self.device)
-        
-        # Split into attention heads
-        batch = batch.view(batch_size, seq_length, 
-                         self.config.attention_heads, -1)
-        
-        # Compute attention scores
-        scores = torch.matmul(batch, batch.transpose(-2, -1)) / np.sqrt(hidden_size)
-        scores = scores.masked_fill(attention_mask.unsqueeze(1).unsqueeze(2) == 0, float('-inf'))
-        attention_weights = torch.softmax(scores, dim=-1)
-        
-        # Apply attention
-        attended = torch.matmul(attention_weights, batch)
+
+        # Split into attention heads: (batch, heads, seq, head_dim)
+        batch = batch.view(batch_size, seq_length,
+                         self.config.attention_heads, -1).transpose(1, 2)
+
+        # Fused flash-attention kernel: tiles Q/K/V and keeps a running
+        # softmax so the full seq x seq score matrix is never
+        # materialized in device memory
+        attended = torch.nn.functional.scaled_dot_product_attention(
+            batch, batch, batch
+        )
+
+        attended = attended.transpose(1, 2).reshape(
+            batch_size, seq_length, hidden_size
+        )
         return [tensor for tensor in attended]
 
     @staticmethod
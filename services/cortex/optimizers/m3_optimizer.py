@@ -52,20 +52,17 @@ class M3Optimizer:
         """Process tokens in optimized batches"""
         self.batch_size = self.resource_monitor.adjust_batch_size()
         
-        batches = torch.split(tokens, self.batch_size)
+        batches = torch.split(tokens.to(self.device), self.batch_size)
         results = []
-        
+
         for batch in batches:
-            # Move batch to MPS device
-            batch = batch.to(self.device)
-            
-            # Process using Metal-optimized operations
+            # Process using Metal-optimized operations; keep the result on
+            # the device so each batch does not block on a GPU sync
             with torch.mps.device():
-                processed = self._process_batch(batch)
-            
-            results.append(processed.cpu())
-        
-        return torch.cat(results)
+                results.append(self._process_batch(batch))
+
+        # Concatenate on-device and synchronize once at the end
+        return torch.cat(results).cpu()
     
     def _process_batch(self, batch: torch.Tensor) -> torch.Tensor:
         """Metal-optimized batch processing"""
@@ -1,4 +1,5 @@
 from typing import Optional, Union, Dict, List
+import asyncio
 import torch
 from transformers import AutoModel, AutoTokenizer
 from .metal_accelerator import MetalAccelerator, MetalConfig
@@ -34,6 +35,10 @@ class PipelineOrchestrator:
         
     async def _load_local_model(self, pipeline_type: PipelineType):
         """Load appropriate model based on pipeline type"""
+        self._load_local_model_sync(pipeline_type)
+
+    def _load_local_model_sync(self, pipeline_type: PipelineType):
+        """Blocking model load shared by the request path and warmup"""
         if pipeline_type not in self.local_models:
             if pipeline_type == PipelineType.CORTEX:
                 model_name = "facebook/opt-350m"  # Smaller model optimized for M3
@@ -42,7 +47,7 @@ class PipelineOrchestrator:
             elif pipeline_type == PipelineType.GRAPH_ML:
                 model_name = "microsoft/graphormer-base"  # Graph-focused model
             
-            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
             model = AutoModel.from_pretrained(model_name)
             
             # Optimize for Metal
@@ -50,7 +55,11 @@ class PipelineOrchestrator:
             
             self.local_models[pipeline_type] = model
             self.tokenizers[pipeline_type] = tokenizer
-    
+
+    async def warmup(self, pipeline_type: PipelineType = PipelineType.CORTEX) -> None:
+        """Preload a local model on a worker thread, off the request path"""
+        await asyncio.to_thread(self._load_local_model_sync, pipeline_type)
+
     async def _process_local(self, request: PipelineRequest) -> Dict:
         """Process using local M3 acceleration"""
         await self._load_local_model(request.pipeline_type)
@@ -69,8 +78,10 @@ class PipelineOrchestrator:
         with torch.no_grad():
             outputs = model(**inputs)
             
+        # Keep the ndarray as-is; orjson serializes NumPy directly without
+        # boxing every float into a Python object
         return {
-            "embeddings": outputs.last_hidden_state.mean(dim=1).cpu().numpy().tolist(),
+            "embeddings": outputs.last_hidden_state.mean(dim=1).cpu().numpy(),
             "model_type": "local_m3",
             "pipeline": request.pipeline_type
         }
@@ -3,7 +3,6 @@ from typing import Dict, List, Optional, Set
 import psutil
 import torch
 import numpy as np
-from collections import deque
 import networkx as nx
 from datetime import datetime
 import asyncio
@@ -31,7 +30,7 @@ class ProcessAnalyzer:
         self.metal_config = metal_config or MetalConfig()
         self.accelerator = MetalAccelerator(self.metal_config)
         self.process_graph = nx.DiGraph()
-        self.history = {}  # pid -> deque(ProcessMetrics)
+        self.history = {}  # pid -> SoA ring buffers of cpu/mem samples
         self.history_length = 100
         self.embeddings_cache = {}
         
@@ -51,7 +50,7 @@ class ProcessAnalyzer:
     def load_models(self):
         """Load models optimized for M3"""
         self.model = AutoModel.from_pretrained("microsoft/codebert-base")
-        self.tokenizer = AutoTokenizer.from_pretrained("microsoft/codebert-base")
+        self.tokenizer = AutoTokenizer.from_pretrained("microsoft/codebert-base", use_fast=True)
         self.model = self.accelerator.prepare_model(self.model)
     
     async def update_process_graph(self):
@@ -83,9 +82,7 @@ class ProcessAnalyzer:
                 )
                 
                 # Update history
-                if metrics.pid not in self.history:
-                    self.history[metrics.pid] = deque(maxlen=self.history_length)
-                self.history[metrics.pid].append(metrics)
+                self._record_history(metrics)
                 
                 # Calculate anomaly score
                 metrics.anomaly_score = self._calculate_anomaly_score(metrics)
@@ -116,17 +113,38 @@ class ProcessAnalyzer:
         self.process_graph = new_graph
         return self.process_graph
     
+    def _record_history(self, metrics: ProcessMetrics) -> None:
+        """Append cpu/mem samples to the per-pid ring buffers"""
+        hist = self.history.get(metrics.pid)
+        if hist is None:
+            hist = self.history[metrics.pid] = {
+                'cpu': np.zeros(self.history_length),
+                'mem': np.zeros(self.history_length),
+                'idx': 0,
+                'count': 0
+            }
+        i = hist['idx']
+        hist['cpu'][i] = metrics.cpu_percent
+        hist['mem'][i] = metrics.memory_percent
+        hist['idx'] = (i + 1) % self.history_length
+        hist['count'] = min(hist['count'] + 1, self.history_length)
+
+    def _history_view(self, hist: Dict, key: str) -> np.ndarray:
+        """Oldest-to-newest view of a ring buffer"""
+        if hist['count'] < self.history_length:
+            return hist[key][:hist['count']]
+        return np.roll(hist[key], -hist['idx'])
+
     def _calculate_anomaly_score(self, metrics: ProcessMetrics) -> float:
         """Calculate anomaly score using historical data"""
-        if len(self.history[metrics.pid]) < 2:
+        hist = self.history[metrics.pid]
+        if hist['count'] < 2:
             return 0.0
-            
-        history = list(self.history[metrics.pid])
-        
-        # Calculate rate of change
-        cpu_change = np.diff([h.cpu_percent for h in history])
-        mem_change = np.diff([h.memory_percent for h in history])
-        
+
+        # Calculate rate of change on the raw sample arrays
+        cpu_change = np.diff(self._history_view(hist, 'cpu'))
+        mem_change = np.diff(self._history_view(hist, 'mem'))
+
         # Calculate z-scores
         cpu_zscore = np.abs(np.mean(cpu_change) / (np.std(cpu_change) + 1e-6))
         mem_zscore = np.abs(np.mean(mem_change) / (np.std(mem_change) + 1e-6))
@@ -160,15 +178,15 @@ class ProcessAnalyzer:
         # Cache embedding
         self.embeddings_cache[metrics.pid] = embedding
         
-        # Calculate similarity with other processes
-        if len(self.embeddings_cache) > 1:
-            similarities = []
-            for other_pid, other_emb in self.embeddings_cache.items():
-                if other_pid != metrics.pid:
-                    sim = torch.cosine_similarity(embedding, other_emb)
-                    similarities.append(float(sim))
-            return float(np.mean(similarities))
-        
+        # Calculate similarity with other processes in one batched GEMM
+        # instead of a per-vector cosine loop
+        others = [emb for pid, emb in self.embeddings_cache.items()
+                  if pid != metrics.pid]
+        if others:
+            stacked = torch.cat(others, dim=0)
+            sims = torch.cosine_similarity(embedding, stacked)
+            return float(sims.mean())
+
         return 0.0
     
     def get_process_insights(self, pid: int) -> Dict:
@@ -186,9 +204,9 @@ class ProcessAnalyzer:
         
         # Get historical trends
         if pid in self.history:
-            history = list(self.history[pid])
-            cpu_trend = np.mean([h.cpu_percent for h in history[-10:]])
-            mem_trend = np.mean([h.memory_percent for h in history[-10:]])
+            hist = self.history[pid]
+            cpu_trend = float(np.mean(self._history_view(hist, 'cpu')[-10:]))
+            mem_trend = float(np.mean(self._history_view(hist, 'mem')[-10:]))
         else:
             cpu_trend = mem_trend = 0.0
         
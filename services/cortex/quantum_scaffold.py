@@ -71,7 +71,7 @@ class QuantumScaffold:
                 model = self.accelerator.prepare_model(model)
                 self.models[purpose] = {
                     "model": model,
-                    "tokenizer": AutoTokenizer.from_pretrained(model_name),
+                    "tokenizer": AutoTokenizer.from_pretrained(model_name, use_fast=True),
                     "priority": priority
                 }
     
@@ -1,4 +1,5 @@
 import psutil
+import time
 import torch
 import asyncio
 from typing import Dict, List, Optional, Set
@@ -6,6 +7,8 @@ from dataclasses import dataclass
 from enum import Enum
 import numpy as np
 import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 
 class ResourcePriority(Enum):
@@ -45,6 +48,7 @@ class ResourceManager:
         self.managed_pids: Set[int] = set()
         self.logger = logging.getLogger("ResourceManager")
         self.metrics = {}
+        self._metrics_sampled_at = 0.0
         self._setup_logging()
         
     async def start(self):
@@ -53,10 +57,15 @@ class ResourceManager:
         return self
     
     def _setup_logging(self):
-        handler = logging.FileHandler("resource_manager.log")
+        # Queue the records and do the actual file I/O on a listener
+        # thread so logging never blocks the event loop on disk writes
+        file_handler = logging.FileHandler("resource_manager.log")
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        file_handler.setFormatter(formatter)
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
         self.logger.setLevel(logging.INFO)
     
     async def register_process(self, pid: int, name: str, priority: ResourcePriority) -> None:
@@ -75,16 +84,16 @@ class ResourceManager:
             )
             self.processes[pid] = info
             self.managed_pids.add(pid)
-            self.logger.info(f"Registered process {name} (PID: {pid}) with {priority} priority")
+            self.logger.info("Registered process %s (PID: %s) with %s priority", name, pid, priority)
         except psutil.NoSuchProcess:
-            self.logger.error(f"Failed to register process {pid}: Process not found")
+            self.logger.error("Failed to register process %s: Process not found", pid)
     
     async def unregister_process(self, pid: int) -> None:
         """Unregister a process from resource management"""
         if pid in self.processes:
             del self.processes[pid]
             self.managed_pids.remove(pid)
-            self.logger.info(f"Unregistered process {pid}")
+            self.logger.info("Unregistered process %s", pid)
     
     @asynccontextmanager
     async def resource_lock(self, resource_type: str, priority: ResourcePriority):
@@ -125,7 +134,7 @@ class ResourceManager:
     
     async def _release_resource(self, resource_type: str) -> None:
         """Release a resource lock"""
-        self.logger.debug(f"Released {resource_type} resource")
+        self.logger.debug("Released %s resource", resource_type)
     
     async def _get_resource_usage(self, resource_type: str) -> float:
         """Get current resource usage percentage"""
@@ -143,18 +152,10 @@ class ResourceManager:
         """Monitor system resources and manage processes."""
         while True:
             try:
-                # Get current resource usage
-                cpu_percent = psutil.cpu_percent(interval=1)
+                # Get current resource usage without blocking the event loop
+                cpu_percent = psutil.cpu_percent(interval=None)
                 memory = psutil.virtual_memory()
-                
-                # Update metrics
-                self.metrics = {
-                    'cpu_percent': cpu_percent,
-                    'memory_percent': memory.percent,
-                    'memory_used': memory.used,
-                    'memory_total': memory.total
-                }
-                
+
                 # Check for high resource usage
                 if cpu_percent > 80 or memory.percent > 80:
                     # Get all processes sorted by CPU usage
@@ -187,9 +188,19 @@ class ResourceManager:
                 
                 await asyncio.sleep(2)  # Reduced monitoring frequency
             except Exception as e:
-                logging.error(f"Error in resource monitoring: {e}")
+                logging.error("Error in resource monitoring: %s", e)
                 await asyncio.sleep(5)  # Wait before retrying
     
     async def get_resource_metrics(self) -> Dict:
-        """Get current resource metrics for monitoring"""
+        """Get current resource metrics, sampled lazily with a 1s memo"""
+        now = time.monotonic()
+        if now - self._metrics_sampled_at >= 1.0:
+            memory = psutil.virtual_memory()
+            self.metrics = {
+                'cpu_percent': psutil.cpu_percent(interval=None),
+                'memory_percent': memory.percent,
+                'memory_used': memory.used,
+                'memory_total': memory.total
+            }
+            self._metrics_sampled_at = now
         return self.metrics
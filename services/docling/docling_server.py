@@ -1,11 +1,12 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import docling
 import json
 
-app = FastAPI(title="Docling API Server")
+app = FastAPI(title="Docling API Server", default_response_class=ORJSONResponse)
 analyzer = docling.DocumentAnalyzer()
 
 class AnalysisRequest(BaseModel):
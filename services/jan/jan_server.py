@@ -1,13 +1,67 @@
 from fastapi import FastAPI, HTTPException, WebSocket
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import asyncio
 import json
 from m3_ide.api.jan_client import JANClient
 
-app = FastAPI(title="JAN API Server")
+app = FastAPI(title="JAN API Server", default_response_class=ORJSONResponse)
 client = JANClient()
 
+class DynamicBatcher:
+    """Coalesce concurrent embedding requests into single batched forward passes"""
+
+    def __init__(self, client: JANClient, max_batch: int = 32, max_wait_ms: float = 10.0):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+
+    async def embed(self, code: str):
+        """Queue a snippet for embedding and wait for the batched result"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((code, future))
+        return await future
+
+    async def _drain(self) -> None:
+        while True:
+            code, future = await self.queue.get()
+            batch = [(code, future)]
+            # Gather whatever else arrives within the batching window
+            deadline = asyncio.get_running_loop().time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            codes = [item[0] for item in batch]
+            try:
+                embeddings = await asyncio.to_thread(self.client.embed_batch, codes)
+                for (_, fut), embedding in zip(batch, embeddings):
+                    if not fut.done():
+                        fut.set_result(embedding[None, :])
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+
+batcher = DynamicBatcher(client)
+
+@app.on_event("startup")
+async def start_batcher():
+    batcher.start()
+
 class CodeAnalysisRequest(BaseModel):
     code: str
     context: Optional[Dict] = None
@@ -23,12 +77,16 @@ class CodeAnalysisResponse(BaseModel):
 async def analyze_code(request: CodeAnalysisRequest):
     """Analyze code using quantum-inspired JAN"""
     try:
+        # Embed through the dynamic batcher so concurrent requests share
+        # a single CodeBERT forward pass
+        code_embedding = await batcher.embed(request.code)
         result = client.analyze_code(
             request.code,
             request.context,
-            request.quantum_state
+            request.quantum_state,
+            code_embedding=code_embedding
         )
-        
+
         # Add timestamp to quantum state
         result['quantum_state']['timestamp'] = datetime.now().isoformat()
         